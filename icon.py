@@ -3,13 +3,43 @@ Generate an icon for the VSCode Extension Resetter.
 """
 
 import base64
+import functools
 import os
 from PIL import Image, ImageDraw, ImageFont
 
-def generate_icon():
+ICON_SIZES = [(32, 32), (64, 64), (128, 128), (256, 256)]
+
+@functools.lru_cache(maxsize=None)
+def load_font(size):
+    """
+    Load the icon font, falling back to the default font if Arial is missing.
+    """
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except IOError:
+        return ImageFont.load_default()
+
+def icons_up_to_date():
+    """
+    Check whether the icon files are newer than this script.
+    """
+    source_mtime = os.path.getmtime(__file__)
+    return all(
+        os.path.exists(path) and os.path.getmtime(path) > source_mtime
+        for path in ("icon.png", "icon.ico")
+    )
+
+def generate_icon(force=False):
     """
     Generate a simple icon for the application.
+
+    Args:
+        force (bool): Regenerate the icon files even if they are up to date
     """
+    if not force and icons_up_to_date():
+        print("Icon files are up to date: icon.png and icon.ico")
+        return
+
     # Create a new image with a white background
     img = Image.new('RGBA', (256, 256), color=(255, 255, 255, 0))
     draw = ImageDraw.Draw(img)
@@ -18,18 +48,16 @@ def generate_icon():
     draw.rounded_rectangle([(20, 20), (236, 236)], radius=30, fill=(0, 122, 204, 255))
     
     # Draw a white "R" in the center
-    try:
-        font = ImageFont.truetype("arial.ttf", 150)
-    except IOError:
-        font = ImageFont.load_default()
+    font = load_font(150)
     
     draw.text((85, 50), "R", fill=(255, 255, 255, 255), font=font)
     
     # Save the image as PNG
     img.save("icon.png")
     
-    # Save as ICO for Windows
-    img.save("icon.ico", format="ICO", sizes=[(32, 32), (64, 64), (128, 128), (256, 256)])
+    # Save as ICO for Windows, resampling each size once up front
+    resized = [img.resize(size, Image.LANCZOS) for size in ICON_SIZES if size != img.size]
+    img.save("icon.ico", format="ICO", sizes=ICON_SIZES, append_images=resized)
     
     print("Icon files generated: icon.png and icon.ico")
 
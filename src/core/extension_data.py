@@ -2,8 +2,10 @@
 Extension data handling for VSCode Extension Resetter.
 """
 
+import os
 import shutil
 import sqlite3
+import threading
 from pathlib import Path
 
 from .utils import (
@@ -11,9 +13,14 @@ from .utils import (
     get_extensions_path,
     backup_file,
     restore_file,
+    copy_tree,
+    memoize_dir_listing,
     logger
 )
 
+# Serializes work on the state database when extensions are reset concurrently
+_STATE_DB_LOCK = threading.Lock()
+
 def get_extension_storage_path(extension_id):
     """
     Get the path to an extension's storage directory.
@@ -49,16 +56,10 @@ def backup_extension_data(extension_id, backup_id=None):
         return backup_id, False
 
     backup_dir = get_backup_dir() / backup_id / "extensions" / extension_id
-    backup_dir.mkdir(exist_ok=True, parents=True)
 
     try:
-        # Copy all files from extension storage to backup
-        for item in extension_path.glob("**/*"):
-            if item.is_file():
-                rel_path = item.relative_to(extension_path)
-                backup_item = backup_dir / rel_path
-                backup_item.parent.mkdir(exist_ok=True, parents=True)
-                shutil.copy2(str(item), str(backup_item))
+        # Copy the extension storage tree to backup
+        copy_tree(extension_path, backup_dir)
 
         logger.info(f"Backed up extension data for {extension_id} to {backup_dir}")
         return backup_id, True
@@ -113,32 +114,39 @@ def reset_extension_state_in_db(extension_id):
         logger.warning(f"VSCode state database not found at {db_path}")
         return False
 
-    try:
-        # Backup the database first
-        backup_file(db_path)
-
-        # Connect to the database
-        conn = sqlite3.connect(str(db_path))
-        cursor = conn.cursor()
-
-        # Find and delete extension-related entries
-        cursor.execute("SELECT key FROM ItemTable WHERE key LIKE ?", (f"%{extension_id}%",))
-        keys = cursor.fetchall()
-
-        if keys:
-            for key in keys:
-                cursor.execute("DELETE FROM ItemTable WHERE key = ?", (key[0],))
-
-            conn.commit()
-            logger.info(f"Removed {len(keys)} entries for {extension_id} from state database")
-        else:
-            logger.info(f"No entries found for {extension_id} in state database")
-
-        conn.close()
-        return True
-    except Exception as e:
-        logger.error(f"Failed to reset extension state in database for {extension_id}: {e}")
-        return False
+    with _STATE_DB_LOCK:
+        try:
+            # Backup the database first
+            backup_file(db_path)
+
+            # Connect to the database
+            conn = sqlite3.connect(str(db_path))
+            try:
+                # Only per-connection settings; the journal mode belongs to the file and VSCode
+                conn.execute("PRAGMA mmap_size=268435456")
+                conn.execute("PRAGMA temp_store=MEMORY")
+
+                # Delete extension-related entries in a single statement and transaction
+                conn.execute("BEGIN IMMEDIATE")
+                # Escape LIKE wildcards so an ID such as "my_ext" only matches literally
+                pattern = extension_id.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                cursor = conn.execute(
+                    "DELETE FROM ItemTable WHERE key LIKE ? ESCAPE '\\'",
+                    (f"%{pattern}%",)
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+            if cursor.rowcount:
+                logger.info(f"Removed {cursor.rowcount} entries for {extension_id} from state database")
+            else:
+                logger.info(f"No entries found for {extension_id} in state database")
+
+            return True
+        except Exception as e:
+            logger.error(f"Failed to reset extension state in database for {extension_id}: {e}")
+            return False
 
 def restore_extension_data(extension_id, backup_id):
     """
@@ -165,16 +173,8 @@ def restore_extension_data(extension_id, backup_id):
         if extension_path.exists():
             shutil.rmtree(str(extension_path))
 
-        # Create extension directory
-        extension_path.mkdir(exist_ok=True, parents=True)
-
-        # Copy all files from backup to extension storage
-        for item in backup_dir.glob("**/*"):
-            if item.is_file():
-                rel_path = item.relative_to(backup_dir)
-                restore_item = extension_path / rel_path
-                restore_item.parent.mkdir(exist_ok=True, parents=True)
-                shutil.copy2(str(item), str(restore_item))
+        # Copy the backup tree to extension storage
+        copy_tree(backup_dir, extension_path)
 
         logger.info(f"Restored extension data for {extension_id} from {backup_dir}")
         return True
@@ -189,16 +189,20 @@ def _get_possible_storage_paths():
     Returns:
         list: List of possible storage paths
     """
+    standard_user_path = get_vscode_path() / "User"
+    insiders_user_path = get_vscode_path(use_insiders=True) / "User"
+
     # Try standard and insiders paths
     possible_paths = [
-        get_extensions_path(),  # Standard globalStorage
-        get_vscode_path() / "User" / "workspaceStorage",  # Standard workspaceStorage
-        get_vscode_path(use_insiders=True) / "User" / "globalStorage",  # Insiders globalStorage
-        get_vscode_path(use_insiders=True) / "User" / "workspaceStorage",  # Insiders workspaceStorage
+        standard_user_path / "globalStorage",  # Standard globalStorage
+        standard_user_path / "workspaceStorage",  # Standard workspaceStorage
+        insiders_user_path / "globalStorage",  # Insiders globalStorage
+        insiders_user_path / "workspaceStorage",  # Insiders workspaceStorage
     ]
 
     return possible_paths
 
+@memoize_dir_listing(_get_possible_storage_paths)
 def list_extension_data():
     """
     List all extensions with data in the global storage.
@@ -212,9 +216,26 @@ def list_extension_data():
     for path in _get_possible_storage_paths():
         if path.exists():
             logger.info(f"Found extension data directory at {path}")
-            extension_dirs.extend([d.name for d in path.iterdir() if d.is_dir()])
+            with os.scandir(path) as it:
+                extension_dirs.extend(entry.name for entry in it if entry.is_dir())
 
     if not extension_dirs:
         logger.warning("No extension data found in any of the possible directories.")
 
     return extension_dirs
+
+def list_extension_data_count():
+    """
+    Count the extensions with data in the global storage without listing them.
+
+    Returns:
+        int: Number of extensions with data
+    """
+    count = 0
+
+    for path in _get_possible_storage_paths():
+        if path.exists():
+            with os.scandir(path) as it:
+                count += sum(1 for entry in it if entry.is_dir())
+
+    return count
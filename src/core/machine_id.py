@@ -2,6 +2,7 @@
 Machine ID handling for VSCode Extension Resetter.
 """
 
+import os
 import logging
 from pathlib import Path
 
@@ -21,13 +22,11 @@ def get_current_machine_id():
         str: Current machine ID or None if not found
     """
     machine_id_path = get_machine_id_path()
-    if not machine_id_path.exists():
+    try:
+        return machine_id_path.read_text(encoding='utf-8').strip()
+    except FileNotFoundError:
         logger.warning(f"Machine ID file not found at {machine_id_path}")
         return None
-    
-    try:
-        with open(machine_id_path, 'r', encoding='utf-8') as f:
-            return f.read().strip()
     except Exception as e:
         logger.error(f"Failed to read machine ID: {e}")
         return None
@@ -56,8 +55,10 @@ def reset_machine_id(backup=True):
         # Create parent directories if they don't exist
         machine_id_path.parent.mkdir(exist_ok=True, parents=True)
         
-        with open(machine_id_path, 'w', encoding='utf-8') as f:
-            f.write(new_id)
+        # Write to a temporary file and swap it in so a crash can't leave a truncated ID
+        tmp_path = machine_id_path.with_suffix(".tmp")
+        tmp_path.write_text(new_id, encoding='utf-8')
+        os.replace(tmp_path, machine_id_path)
         logger.info(f"Machine ID reset from {old_id} to {new_id}")
         return True, backup_id, old_id, new_id
     except Exception as e:
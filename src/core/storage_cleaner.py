@@ -12,9 +12,13 @@ from .utils import (
     get_vscode_path,
     backup_file,
     restore_file,
+    copy_tree,
     logger
 )
 
+# Key prefixes in storage.json that hold extension tracking data
+TRACKING_KEY_PREFIXES = ("extensionIdentifier", "extensionTracker")
+
 def backup_global_storage(backup_id=None):
     """
     Backup the entire global storage directory.
@@ -36,16 +40,10 @@ def backup_global_storage(backup_id=None):
         return backup_id, False
     
     backup_dir = get_backup_dir() / backup_id / "globalStorage"
-    backup_dir.mkdir(exist_ok=True, parents=True)
     
     try:
-        # Copy all files from global storage to backup
-        for item in storage_path.glob("**/*"):
-            if item.is_file():
-                rel_path = item.relative_to(storage_path)
-                backup_item = backup_dir / rel_path
-                backup_item.parent.mkdir(exist_ok=True, parents=True)
-                shutil.copy2(item, backup_item)
+        # Copy the global storage tree to backup
+        copy_tree(storage_path, backup_dir)
         
         logger.info(f"Backed up global storage to {backup_dir}")
         return backup_id, True
@@ -179,15 +177,21 @@ def clean_storage_json():
         
         # Clean extension-related data
         if isinstance(data, dict):
-            cleaned_data = {}
-            for key, value in data.items():
-                # Keep only essential data, remove extension-specific data
-                if not any(key.startswith(prefix) for prefix in ["extensionIdentifier", "extensionTracker"]):
-                    cleaned_data[key] = value
+            # Keep only essential data, remove extension-specific data
+            cleaned_data = {
+                key: value for key, value in data.items()
+                if not key.startswith(TRACKING_KEY_PREFIXES)
+            }
+            
+            if len(cleaned_data) == len(data):
+                logger.info("No tracking data found in storage.json")
+                return True
             
-            # Write cleaned data back
-            with open(storage_json_path, 'w', encoding='utf-8') as f:
-                json.dump(cleaned_data, f, indent=2)
+            # Write cleaned data to a temporary file and swap it in atomically
+            tmp_path = storage_json_path.with_suffix(".json.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(cleaned_data, f)
+            os.replace(tmp_path, storage_json_path)
             
             logger.info(f"Cleaned storage.json file")
             return True
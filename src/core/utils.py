@@ -7,11 +7,25 @@ import sys
 import platform
 import json
 import shutil
-import uuid
+import secrets
+import functools
 import logging
-from datetime import datetime
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Constants
 VSCODE_STANDARD = "Code"
 VSCODE_INSIDERS = "Code - Insiders"
@@ -27,6 +41,7 @@ logging.basicConfig(
 
 logger = logging.getLogger("vscode_resetter")
 
+@functools.lru_cache(maxsize=None)
 def get_platform():
     """
     Determine the current operating system.
@@ -42,6 +57,7 @@ def get_platform():
     else:
         return "linux"
 
+@functools.lru_cache(maxsize=None)
 def get_vscode_path(use_insiders=False):
     """
     Get the path to VSCode installation based on the platform.
@@ -64,6 +80,7 @@ def get_vscode_path(use_insiders=False):
     else:  # linux
         return home / ".config" / code_dir
 
+@functools.lru_cache(maxsize=None)
 def get_machine_id_path():
     """
     Get the path to the VSCode machine ID file.
@@ -73,6 +90,7 @@ def get_machine_id_path():
     """
     return get_vscode_path() / "machineId"
 
+@functools.lru_cache(maxsize=None)
 def get_extensions_path():
     """
     Get the path to the VSCode extensions directory.
@@ -102,8 +120,10 @@ def set_backup_dir(path=None):
     else:
         backup_dir = get_vscode_path() / "resetter_backups"
 
-    backup_dir.mkdir(exist_ok=True, parents=True)
-    DEFAULT_BACKUP_DIR = backup_dir
+    # Callers pass the same location over and over, so only create it when it changes
+    if backup_dir != DEFAULT_BACKUP_DIR:
+        backup_dir.mkdir(exist_ok=True, parents=True)
+        DEFAULT_BACKUP_DIR = backup_dir
     return backup_dir
 
 def get_backup_dir():
@@ -120,6 +140,9 @@ def get_backup_dir():
 
     return DEFAULT_BACKUP_DIR
 
+# Last generated backup ID as (second, backup_id); IDs only change once per second
+_LAST_BACKUP_ID = (None, None)
+
 def create_backup_id():
     """
     Create a unique backup ID based on the current timestamp.
@@ -127,8 +150,16 @@ def create_backup_id():
     Returns:
         str: Unique backup ID
     """
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    return f"backup_{timestamp}"
+    global _LAST_BACKUP_ID
+
+    now = int(time.time())
+    second, backup_id = _LAST_BACKUP_ID
+    if second != now:
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.localtime(now))
+        backup_id = f"backup_{timestamp}"
+        _LAST_BACKUP_ID = (now, backup_id)
+
+    return backup_id
 
 def backup_file(file_path, backup_id=None, custom_dir=None):
     """
@@ -160,7 +191,7 @@ def backup_file(file_path, backup_id=None, custom_dir=None):
 
     # Create relative path structure in backup
     try:
-        rel_path = file_path.relative_to(get_vscode_path()) if file_path.is_relative_to(get_vscode_path()) else Path(file_path.name)
+        rel_path = file_path.relative_to(get_vscode_path())
     except ValueError:
         # If the file is not relative to VSCode path, just use the filename
         rel_path = Path(file_path.name)
@@ -204,6 +235,233 @@ def restore_file(backup_path, original_path):
         logger.error(f"Failed to restore {original_path}: {e}")
         return False
 
+def _scandir_files(root, rel_root=Path()):
+    """
+    Recursively yield the files below a directory using os.scandir.
+
+    Args:
+        root (str or Path): Directory to walk
+        rel_root (Path): Relative path of root within the walk
+
+    Yields:
+        tuple: (rel_path, full_path) for each file
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_files(entry.path, rel_root / entry.name)
+            elif entry.is_file():
+                yield rel_root / entry.name, entry.path
+
+# Copies with fewer files than this run serially rather than on the I/O pool
+PARALLEL_COPY_MIN_FILES = 16
+
+_IO_EXECUTOR = None
+_IO_EXECUTOR_LOCK = threading.Lock()
+
+def _get_io_executor():
+    """
+    Get the thread pool shared by all file operations, creating it on first use.
+
+    One pool bounds the number of I/O threads even when several backups or resets
+    run at once. Work submitted to it must never wait on the pool itself.
+
+    Returns:
+        ThreadPoolExecutor: Shared I/O thread pool
+    """
+    global _IO_EXECUTOR
+    with _IO_EXECUTOR_LOCK:
+        if _IO_EXECUTOR is None:
+            max_workers = 64 if get_platform() == "windows" else 16
+            _IO_EXECUTOR = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vscr-io")
+        return _IO_EXECUTOR
+
+def copy_tree(src, dst):
+    """
+    Copy all files from one directory tree to another, using the shared I/O pool for large trees.
+
+    Args:
+        src (Path): Source directory
+        dst (Path): Destination directory, created if missing
+    """
+    pairs = [(full_path, dst / rel_path) for rel_path, full_path in _scandir_files(src)]
+
+    # Create each destination directory once, parents first, so the copy workers don't race on mkdir
+    dst.mkdir(exist_ok=True, parents=True)
+    for directory in sorted({dst_path.parent for _, dst_path in pairs}, key=lambda d: len(d.parts)):
+        directory.mkdir(exist_ok=True, parents=True)
+
+    # A handful of files isn't worth handing off to the pool
+    if len(pairs) < PARALLEL_COPY_MIN_FILES:
+        for src_path, dst_path in pairs:
+            shutil.copy2(src_path, dst_path)
+        return
+
+    # File copies are I/O-bound, so threads overlap the per-file latency
+    # shutil.copy2 already copies in the kernel where it can, such as sendfile on Linux
+    list(_get_io_executor().map(lambda pair: shutil.copy2(*pair), pairs))
+
+def find_named(root, target):
+    """
+    Find all files with a given name below a directory.
+
+    Walks the tree iteratively with os.scandir, using the cached entry types
+    to decide what to descend into. A root that doesn't exist yields nothing.
+
+    Args:
+        root (str): Directory to search
+        target (str): File name to look for
+
+    Yields:
+        str: Path of each matching file
+    """
+    pending = deque([root])
+    while pending:
+        directory = pending.popleft()
+        try:
+            it = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name == target:
+                    yield entry.path
+
+# Where VSCode keeps its machineid file, relative to a data directory
+MACHINE_ID_SUBPATHS = ("machineid", os.path.join("User", "machineid"))
+
+def find_machine_id_files(root, deep_scan=False):
+    """
+    Find machineid files under a VSCode data directory.
+
+    The known locations are checked first. The whole tree is searched when none
+    of them has a machineid file, or always when deep_scan is set.
+
+    Args:
+        root (str): Directory to search
+        deep_scan (bool): Whether to search the entire tree even if a known location matches
+
+    Returns:
+        list: Paths of the machineid files found
+    """
+    if not deep_scan:
+        candidates = (os.path.join(root, subpath) for subpath in MACHINE_ID_SUBPATHS)
+        found = [candidate for candidate in candidates if os.path.isfile(candidate)]
+        if found:
+            return found
+
+    return list(find_named(root, "machineid"))
+
+def _safe_unlink(path):
+    """
+    Remove a file, logging instead of raising on failure.
+
+    Args:
+        path (str or Path): File to remove
+
+    Returns:
+        bool: True if the file was removed, False otherwise
+    """
+    try:
+        os.unlink(path)
+        logger.info(f"Removed {path}")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to remove {path}: {e}")
+        return False
+
+def remove_files(paths):
+    """
+    Remove several files in parallel.
+
+    Unlink calls release the GIL, so the shared I/O pool overlaps their latency,
+    which matters on Windows where filter drivers slow down each delete.
+
+    Args:
+        paths (list): Files to remove
+
+    Returns:
+        bool: True if every file was removed, False otherwise
+    """
+    if not paths:
+        return True
+
+    return all(list(_get_io_executor().map(_safe_unlink, paths)))
+
+# How long a directory listing may be reused while its directories are unchanged
+DIR_LISTING_TTL = 0.5
+
+def _dir_mtimes(dirs):
+    """
+    Get the modification times of directories, used to tell whether a listing is stale.
+
+    Args:
+        dirs (tuple): Directories to check
+
+    Returns:
+        tuple: st_mtime_ns of each directory, or None for those that don't exist
+    """
+    mtimes = []
+    for directory in dirs:
+        try:
+            mtimes.append(os.stat(directory).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+def memoize_dir_listing(get_dirs):
+    """
+    Cache a function that lists directories until they change or DIR_LISTING_TTL passes.
+
+    Back-to-back refreshes then scan each directory once. Adding or removing an entry
+    changes the directory's mtime, which invalidates the cached listing right away.
+
+    Args:
+        get_dirs (callable): Takes the wrapped function's arguments and returns the
+            directories it lists
+
+    Returns:
+        callable: Decorator applying the cache
+    """
+    def decorator(func):
+        cache = {}
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            dirs = tuple(str(d) for d in get_dirs(*args, **kwargs))
+            mtimes = _dir_mtimes(dirs)
+            now = time.monotonic()
+
+            cached = cache.get(dirs)
+            if cached and cached[1] == mtimes and now - cached[2] < DIR_LISTING_TTL:
+                return list(cached[0])
+
+            result = func(*args, **kwargs)
+            cache[dirs] = (result, mtimes, now)
+            return list(result)
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+def _resolve_backup_dir(custom_dir=None):
+    """
+    Get the backup directory to use, given an optional custom location.
+
+    Args:
+        custom_dir (str or Path, optional): Custom backup directory. If None, use default.
+
+    Returns:
+        Path: Backup directory
+    """
+    if custom_dir:
+        return Path(custom_dir) / "vscode_resetter_backups"
+    return get_backup_dir()
+
+@memoize_dir_listing(lambda custom_dir=None: (_resolve_backup_dir(custom_dir),))
 def list_backups(custom_dir=None):
     """
     List all available backups.
@@ -214,16 +472,31 @@ def list_backups(custom_dir=None):
     Returns:
         list: List of backup IDs
     """
-    if custom_dir:
-        backup_dir = Path(custom_dir) / "vscode_resetter_backups"
-    else:
-        backup_dir = get_backup_dir()
+    backup_dir = _resolve_backup_dir(custom_dir)
 
     if not backup_dir.exists():
         return []
 
     return [d.name for d in backup_dir.iterdir() if d.is_dir()]
 
+def list_backups_count(custom_dir=None):
+    """
+    Count the available backups without building the list of IDs.
+
+    Args:
+        custom_dir (str or Path, optional): Custom backup directory. If None, use default.
+
+    Returns:
+        int: Number of backups
+    """
+    backup_dir = _resolve_backup_dir(custom_dir)
+
+    try:
+        with os.scandir(backup_dir) as it:
+            return sum(1 for entry in it if entry.is_dir())
+    except FileNotFoundError:
+        return 0
+
 def _get_possible_extension_paths():
     """
     Get a list of possible extension paths.
@@ -231,21 +504,50 @@ def _get_possible_extension_paths():
     Returns:
         list: List of possible extension paths
     """
+    standard_path = get_vscode_path()
+    insiders_path = get_vscode_path(use_insiders=True)
+
     possible_paths = [
-        get_vscode_path() / "extensions",  # Standard path
-        get_vscode_path(use_insiders=True) / "extensions",  # Insiders path
+        standard_path / "extensions",  # Standard path
+        insiders_path / "extensions",  # Insiders path
         Path(os.environ.get("USERPROFILE", "")) / ".vscode" / "extensions",  # User profile path
     ]
 
     # Add local installation paths
     if get_platform() == "windows":
+        programs_path = Path(os.environ.get("LOCALAPPDATA", "")) / "Programs"
         possible_paths.extend([
-            Path(os.environ.get("LOCALAPPDATA", "")) / "Programs" / "Microsoft VS Code" / "resources" / "app" / "extensions",
-            Path(os.environ.get("LOCALAPPDATA", "")) / "Programs" / "Microsoft VS Code Insiders" / "resources" / "app" / "extensions"
+            programs_path / "Microsoft VS Code" / "resources" / "app" / "extensions",
+            programs_path / "Microsoft VS Code Insiders" / "resources" / "app" / "extensions"
         ])
 
     return possible_paths
 
+# Manifest keys used from an extension's package.json
+MANIFEST_KEYS = frozenset(("name", "publisher", "displayName", "version"))
+
+# Manifests larger than this are streamed instead of fully parsed, when ijson is available
+LARGE_MANIFEST_SIZE = 64 * 1024
+
+def _stream_manifest_keys(package_json):
+    """
+    Read the manifest keys from a package.json file, stopping once all are found.
+
+    Args:
+        package_json (Path): Path to the package.json file
+
+    Returns:
+        dict: The manifest keys found in the file
+    """
+    data = {}
+    with open(package_json, 'rb') as f:
+        for key, value in ijson.kvitems(f, ''):
+            if key in MANIFEST_KEYS:
+                data[key] = value
+                if len(data) == len(MANIFEST_KEYS):
+                    break
+    return data
+
 def _parse_extension_package_json(package_json):
     """
     Parse an extension's package.json file.
@@ -260,16 +562,29 @@ def _parse_extension_package_json(package_json):
         return None
 
     try:
-        with open(package_json, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            if "name" in data and "publisher" in data:
-                ext_id = f"{data['publisher']}.{data['name']}"
-                return {
-                    "id": ext_id,
-                    "name": data.get("displayName", data["name"]),
-                    "version": data.get("version", "unknown"),
-                    "path": str(package_json.parent)
-                }
+        data = None
+        if ijson and package_json.stat().st_size > LARGE_MANIFEST_SIZE:
+            # Large manifests are mostly contribution metadata after the keys we need
+            try:
+                data = _stream_manifest_keys(package_json)
+            except ijson.JSONError:
+                data = None
+
+        if data is None:
+            with open(package_json, 'rb') as f:
+                content = f.read()
+
+            # Prefer orjson's C parser when it is installed
+            data = orjson.loads(content) if orjson else json.loads(content)
+
+        if "name" in data and "publisher" in data:
+            ext_id = f"{data['publisher']}.{data['name']}"
+            return {
+                "id": ext_id,
+                "name": data.get("displayName", data["name"]),
+                "version": data.get("version", "unknown"),
+                "path": str(package_json.parent)
+            }
     except Exception as e:
         logger.error(f"Failed to parse {package_json}: {e}")
 
@@ -282,7 +597,7 @@ def get_extension_list():
     Returns:
         list: List of extension IDs
     """
-    extensions = []
+    package_jsons = []
 
     # Try each possible path
     for extensions_path in _get_possible_extension_paths():
@@ -291,15 +606,19 @@ def get_extension_list():
 
         logger.info(f"Found extensions directory at {extensions_path}")
 
-        # Process each extension directory
-        for ext_dir in extensions_path.glob("*"):
-            if not ext_dir.is_dir():
-                continue
-
-            package_json = ext_dir / "package.json"
-            ext_info = _parse_extension_package_json(package_json)
+        # Collect the manifest of each extension directory
+        with os.scandir(extensions_path) as it:
+            package_jsons.extend(
+                Path(entry.path) / "package.json" for entry in it if entry.is_dir()
+            )
 
-            if ext_info and ext_info not in extensions:
+    # Parse the manifests in parallel, since cold reads dominate
+    extensions = []
+    seen = set()
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        for ext_info in executor.map(_parse_extension_package_json, package_jsons):
+            if ext_info and ext_info["id"] not in seen:
+                seen.add(ext_info["id"])
                 extensions.append(ext_info)
 
     if not extensions:
@@ -312,6 +631,6 @@ def generate_new_machine_id():
     Generate a new random machine ID.
 
     Returns:
-        str: New machine ID
+        str: New machine ID, 64 hex characters like the ones VSCode generates
     """
-    return str(uuid.uuid4())
+    return secrets.token_hex(32)
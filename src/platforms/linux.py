@@ -7,7 +7,7 @@ import shutil
 import subprocess
 from pathlib import Path
 
-from ..core.utils import logger
+from ..core.utils import remove_files, logger
 
 def get_vscode_config_paths():
     """
@@ -38,13 +38,13 @@ def clean_vscode_config():
         if path.exists():
             try:
                 # Don't delete the entire directory, just clean specific files
-                for item in path.glob("**/machineid"):
-                    try:
-                        os.remove(item)
-                        logger.info(f"Removed {item}")
-                    except Exception as e:
-                        logger.error(f"Failed to remove {item}: {e}")
-                        success = False
+                matches = [
+                    os.path.join(dirpath, "machineid")
+                    for dirpath, _dirnames, filenames in os.walk(path)
+                    if "machineid" in filenames
+                ]
+                if not remove_files(matches):
+                    success = False
             except Exception as e:
                 logger.error(f"Failed to clean {path}: {e}")
                 success = False
@@ -60,16 +60,15 @@ def clean_dconf_settings():
     """
     try:
         # Check if dconf is available
-        result = subprocess.run(["which", "dconf"], capture_output=True, text=True)
-        if result.returncode != 0:
+        if shutil.which("dconf") is None:
             logger.warning("dconf not found, skipping dconf settings cleaning")
             return True
         
         # Check for VSCode-related dconf settings
-        result = subprocess.run(["dconf", "list", "/org/gnome/"], capture_output=True, text=True)
+        result = subprocess.run(["dconf", "list", "/org/gnome/"], capture_output=True, text=True, check=False, timeout=5)
         if "vscode/" in result.stdout:
             # Reset VSCode-related dconf settings
-            subprocess.run(["dconf", "reset", "-f", "/org/gnome/vscode/"])
+            subprocess.run(["dconf", "reset", "-f", "/org/gnome/vscode/"], check=False, timeout=5)
             logger.info("Reset VSCode-related dconf settings")
         
         return True
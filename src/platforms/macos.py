@@ -2,27 +2,78 @@
 macOS-specific implementations for VSCode Extension Resetter.
 """
 
-import os
+import json
 import plistlib
 import shutil
 from pathlib import Path
 
-from ..core.utils import logger
+from ..core.utils import find_named, find_machine_id_files, remove_files, get_backup_dir, logger
+
+# Plist keys that hold tracking-related state
+TRACKING_KEYS = frozenset((
+    "NSNavLastRootDirectory",
+    "NSNavLastCurrentDirectory",
+    "NSNavPanelExpandedSizeForOpenMode",
+    "NSNavPanelExpandedSizeForSaveMode"
+))
+
+_MISSING = object()
+
+# VSCode locations under the user's Library, resolved once per process
+_HOME = Path.home()
+# Each candidate is tagged with what it is expected to be, so cleaning needn't stat it
+_PLIST_CANDIDATES = (
+    (_HOME / "Library/Preferences/com.microsoft.VSCode.plist", "file"),
+    (_HOME / "Library/Caches/com.microsoft.VSCode", "dir")
+)
+_APP_SUPPORT_PATHS = (
+    _HOME / "Library/Application Support/Code",
+    _HOME / "Library/Application Support/Visual Studio Code"
+)
 
 def get_vscode_plist_paths():
     """
     Get paths to VSCode-related plist files.
     
     Returns:
-        list: List of plist file paths
+        list: List of (path, kind) tuples, where kind is "file" or "dir"
+    """
+    return [(path, kind) for path, kind in _PLIST_CANDIDATES if path.exists()]
+
+def _get_plist_mtime_cache_path():
+    """
+    Get the path to the file recording plist modification times.
+    
+    Returns:
+        Path: Path to the plist mtime cache file
+    """
+    return get_backup_dir() / "plist_mtime.json"
+
+def _load_plist_mtime_cache():
+    """
+    Load the modification times of plist files as of their last clean.
+    
+    Returns:
+        dict: Mapping of plist path to st_mtime_ns
+    """
+    try:
+        with open(_get_plist_mtime_cache_path(), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_plist_mtime_cache(cache):
     """
-    home = Path.home()
-    paths = [
-        home / "Library" / "Preferences" / "com.microsoft.VSCode.plist",
-        home / "Library" / "Caches" / "com.microsoft.VSCode"
-    ]
+    Save the modification times of cleaned plist files.
     
-    return [p for p in paths if p.exists()]
+    Args:
+        cache (dict): Mapping of plist path to st_mtime_ns
+    """
+    try:
+        with open(_get_plist_mtime_cache_path(), 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        logger.warning(f"Failed to save plist mtime cache: {e}")
 
 def clean_vscode_plist():
     """
@@ -32,27 +83,24 @@ def clean_vscode_plist():
         bool: True if cleaning was successful, False otherwise
     """
     plist_paths = get_vscode_plist_paths()
+    mtime_cache = _load_plist_mtime_cache()
     success = True
     
-    for path in plist_paths:
-        if path.is_file() and path.suffix == ".plist":
+    for path, kind in plist_paths:
+        if kind == "file":
             try:
+                # Skip files that haven't changed since they were last cleaned
+                if mtime_cache.get(str(path)) == path.stat().st_mtime_ns:
+                    continue
+                
                 # Read plist file
                 with open(path, 'rb') as f:
                     data = plistlib.load(f)
                 
                 # Remove tracking-related keys
-                tracking_keys = [
-                    "NSNavLastRootDirectory",
-                    "NSNavLastCurrentDirectory",
-                    "NSNavPanelExpandedSizeForOpenMode",
-                    "NSNavPanelExpandedSizeForSaveMode"
-                ]
-                
                 modified = False
-                for key in tracking_keys:
-                    if key in data:
-                        del data[key]
+                for key in TRACKING_KEYS:
+                    if data.pop(key, _MISSING) is not _MISSING:
                         modified = True
                 
                 if modified:
@@ -61,23 +109,21 @@ def clean_vscode_plist():
                         plistlib.dump(data, f)
                     
                     logger.info(f"Cleaned plist file {path}")
+                
+                mtime_cache[str(path)] = path.stat().st_mtime_ns
             except Exception as e:
                 logger.error(f"Failed to clean plist file {path}: {e}")
                 success = False
-        elif path.is_dir():
+        else:
             try:
                 # Clean cache directory
-                for item in path.glob("**/machineid"):
-                    try:
-                        os.remove(item)
-                        logger.info(f"Removed {item}")
-                    except Exception as e:
-                        logger.error(f"Failed to remove {item}: {e}")
-                        success = False
+                if not remove_files(list(find_named(str(path), "machineid"))):
+                    success = False
             except Exception as e:
                 logger.error(f"Failed to clean directory {path}: {e}")
                 success = False
     
+    _save_plist_mtime_cache(mtime_cache)
     return success
 
 def clean_application_support():
@@ -87,26 +133,15 @@ def clean_application_support():
     Returns:
         bool: True if cleaning was successful, False otherwise
     """
-    home = Path.home()
-    paths_to_clean = [
-        home / "Library" / "Application Support" / "Code",
-        home / "Library" / "Application Support" / "Visual Studio Code"
-    ]
-    
     success = True
-    for path in paths_to_clean:
-        if path.exists():
-            try:
-                # Don't delete the entire directory, just clean specific files
-                for item in path.glob("**/machineid"):
-                    try:
-                        os.remove(item)
-                        logger.info(f"Removed {item}")
-                    except Exception as e:
-                        logger.error(f"Failed to remove {item}: {e}")
-                        success = False
-            except Exception as e:
-                logger.error(f"Failed to clean {path}: {e}")
+    for path in _APP_SUPPORT_PATHS:
+        # Missing directories simply have no matches
+        try:
+            # Don't delete the entire directory, just clean specific files
+            if not remove_files(find_machine_id_files(str(path))):
                 success = False
+        except Exception as e:
+            logger.error(f"Failed to clean {path}: {e}")
+            success = False
     
     return success
@@ -5,9 +5,40 @@ Windows-specific implementations for VSCode Extension Resetter.
 import os
 import winreg
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from ..core.utils import logger
+from ..core.utils import find_machine_id_files, remove_files, logger
+
+# Per-user uninstall entries, where the VSCode user installer registers itself
+UNINSTALL_KEY = r"Software\Microsoft\Windows\CurrentVersion\Uninstall"
+
+# VSCode locations under AppData\Local, resolved once per process
+_LOCAL_APPDATA = os.environ.get("LOCALAPPDATA")
+_APPDATA_LOCAL_PATHS = (
+    Path(_LOCAL_APPDATA) / "Microsoft" / "VSCode",
+    Path(_LOCAL_APPDATA) / "VSCode",
+    Path(_LOCAL_APPDATA) / "Programs" / "Microsoft VS Code"
+) if _LOCAL_APPDATA else ()
+
+def _read_display_name(key, subkey_name):
+    """
+    Read the DisplayName value of an uninstall subkey.
+    
+    Args:
+        key: Open handle to the parent Uninstall key
+        subkey_name (str): Name of the subkey to read
+        
+    Returns:
+        str: Display name, or None if it couldn't be read or isn't a string
+    """
+    try:
+        with winreg.OpenKey(key, subkey_name, 0, winreg.KEY_QUERY_VALUE) as subkey:
+            value, reg_type = winreg.QueryValueEx(subkey, "DisplayName")
+    except OSError:
+        return None
+    
+    return value if reg_type in (winreg.REG_SZ, winreg.REG_EXPAND_SZ) else None
 
 def get_vscode_registry_keys():
     """
@@ -20,21 +51,22 @@ def get_vscode_registry_keys():
     
     try:
         # Check HKEY_CURRENT_USER\Software\Microsoft\Windows\CurrentVersion\Uninstall
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Uninstall") as key:
-            i = 0
-            while True:
-                try:
-                    subkey_name = winreg.EnumKey(key, i)
-                    with winreg.OpenKey(key, subkey_name) as subkey:
-                        try:
-                            display_name = winreg.QueryValueEx(subkey, "DisplayName")[0]
-                            if "Visual Studio Code" in display_name:
-                                keys.append((winreg.HKEY_CURRENT_USER, r"Software\Microsoft\Windows\CurrentVersion\Uninstall\\" + subkey_name))
-                        except:
-                            pass
-                    i += 1
-                except WindowsError:
-                    break
+        # Open the parent once, read-only, and share the handle across all subkey reads
+        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, UNINSTALL_KEY, 0, winreg.KEY_READ) as key:
+            subkey_count, _, _ = winreg.QueryInfoKey(key)
+            
+            # VSCode's installers register under a GUID key such as "{771FD6B0-...}_is1"
+            subkey_names = [
+                name for name in (winreg.EnumKey(key, i) for i in range(subkey_count))
+                if name.startswith("{") or "Microsoft VS" in name
+            ]
+            
+            # Registry reads release the GIL, so probe the subkeys concurrently
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                display_names = executor.map(lambda name: _read_display_name(key, name), subkey_names)
+                for subkey_name, display_name in zip(subkey_names, display_names):
+                    if display_name and "Visual Studio Code" in display_name:
+                        keys.append((winreg.HKEY_CURRENT_USER, UNINSTALL_KEY + "\\" + subkey_name))
     except Exception as e:
         logger.error(f"Failed to get VSCode registry keys: {e}")
     
@@ -58,8 +90,12 @@ def clean_vscode_registry():
                     try:
                         winreg.DeleteValue(key, value_name)
                         logger.info(f"Removed registry value {value_name} from {key_path}")
-                    except:
+                    except FileNotFoundError:
+                        # Value was never set, nothing to remove
                         pass
+                    except OSError as e:
+                        logger.error(f"Failed to remove registry value {value_name} from {key_path}: {e}")
+                        success = False
         except Exception as e:
             logger.error(f"Failed to clean registry key {key_path}: {e}")
             success = False
@@ -73,31 +109,19 @@ def clean_appdata_local():
     Returns:
         bool: True if cleaning was successful, False otherwise
     """
-    local_appdata = os.environ.get("LOCALAPPDATA")
-    if not local_appdata:
+    if not _LOCAL_APPDATA:
         logger.error("LOCALAPPDATA environment variable not found")
         return False
     
-    paths_to_clean = [
-        Path(local_appdata) / "Microsoft" / "VSCode",
-        Path(local_appdata) / "VSCode",
-        Path(local_appdata) / "Programs" / "Microsoft VS Code"
-    ]
-    
     success = True
-    for path in paths_to_clean:
-        if path.exists():
-            try:
-                # Don't delete the entire directory, just clean specific files
-                for item in path.glob("**/machineid"):
-                    try:
-                        os.remove(item)
-                        logger.info(f"Removed {item}")
-                    except Exception as e:
-                        logger.error(f"Failed to remove {item}: {e}")
-                        success = False
-            except Exception as e:
-                logger.error(f"Failed to clean {path}: {e}")
+    for path in _APPDATA_LOCAL_PATHS:
+        # Missing directories simply have no matches
+        try:
+            # Don't delete the entire directory, just clean specific files
+            if not remove_files(find_machine_id_files(str(path))):
                 success = False
+        except Exception as e:
+            logger.error(f"Failed to clean {path}: {e}")
+            success = False
     
     return success
@@ -0,0 +1,22 @@
+"""
+Command-line subcommands for VSCode Extension Resetter, loaded on demand by the CLI.
+"""
+
+import click
+
+def prompt_choice(message, choices):
+    """
+    Let the user pick one item from a numbered list.
+    
+    Args:
+        message (str): Prompt shown below the list
+        choices (list): Items to choose from
+        
+    Returns:
+        The selected item
+    """
+    for i, choice in enumerate(choices, 1):
+        click.echo(f"{i}. {choice}")
+    
+    index = click.prompt(message, type=click.IntRange(1, len(choices)))
+    return choices[index - 1]
@@ -0,0 +1,114 @@
+"""
+Commands for creating, listing and restoring backups.
+"""
+
+import click
+
+from . import prompt_choice
+from ...core.utils import (
+    list_backups,
+    create_backup_id,
+    backup_file,
+    get_backup_dir,
+    get_machine_id_path
+)
+from ...core.machine_id import restore_machine_id
+from ...core.extension_data import (
+    list_extension_data,
+    backup_extension_data,
+    restore_extension_data
+)
+from ...core.storage_cleaner import (
+    backup_global_storage,
+    backup_state_db,
+    restore_state_db
+)
+
+def _do_full_backup(backup_id, include_extensions=False, echo=click.echo):
+    """
+    Back up the machine ID, global storage, state database and optionally extension data.
+    
+    Args:
+        backup_id (str): Backup ID to store everything under
+        include_extensions (bool): Whether to back up each extension's data as well
+        echo (callable): Function used to report progress
+    """
+    # Backup machine ID
+    machine_id_path = get_machine_id_path()
+    if machine_id_path.exists():
+        _, backup_path = backup_file(machine_id_path, backup_id)
+        if backup_path:
+            echo(f"Backed up machine ID to {backup_path}")
+    
+    # Backup global storage
+    _, success = backup_global_storage(backup_id)
+    if success:
+        echo("Backed up global storage")
+    
+    # Backup state database
+    _, success = backup_state_db(backup_id)
+    if success:
+        echo("Backed up state database")
+    
+    # Backup extension data
+    if include_extensions:
+        for ext_id in list_extension_data():
+            _, success = backup_extension_data(ext_id, backup_id)
+            if success:
+                echo(f"Backed up extension data for {ext_id}")
+
+@click.command("backup")
+@click.option("--include-extensions", is_flag=True, help="Include extension data in the backup")
+def backup_cmd(include_extensions):
+    """Create a backup of VSCode configuration."""
+    backup_id = create_backup_id()
+    _do_full_backup(backup_id, include_extensions, click.echo)
+    click.echo(f"Backup created with ID: {backup_id}")
+
+@click.command("list-backups")
+def list_backups_cmd():
+    """List available backups."""
+    backups = list_backups()
+    
+    if not backups:
+        click.echo("No backups found.")
+        return
+    
+    click.echo(f"Found {len(backups)} backups:")
+    for i, backup_id in enumerate(backups, 1):
+        click.echo(f"{i}. {backup_id}")
+
+@click.command("restore")
+@click.argument("backup_id", required=False)
+def restore_cmd(backup_id):
+    """Restore from a backup."""
+    if not backup_id:
+        # Interactive mode: let the user select a backup
+        backups = list_backups()
+        
+        if not backups:
+            click.echo("No backups found.")
+            return
+        
+        backup_id = prompt_choice("Select a backup to restore", backups)
+    
+    # Restore machine ID
+    success = restore_machine_id(backup_id)
+    if success:
+        click.echo("Restored machine ID")
+    
+    # Restore state database
+    success = restore_state_db(backup_id)
+    if success:
+        click.echo("Restored state database")
+    
+    # Restore extension data
+    backup_dir = get_backup_dir() / backup_id / "extensions"
+    if backup_dir.exists():
+        extension_data = [d.name for d in backup_dir.iterdir() if d.is_dir()]
+        for ext_id in extension_data:
+            success = restore_extension_data(ext_id, backup_id)
+            if success:
+                click.echo(f"Restored extension data for {ext_id}")
+    
+    click.echo(f"Restore from backup {backup_id} completed.")
@@ -0,0 +1,95 @@
+"""
+The clean-all command.
+"""
+
+import click
+
+from ...core.utils import get_platform, create_backup_id
+from ...core.machine_id import reset_machine_id
+from ...core.storage_cleaner import (
+    clean_global_storage,
+    reset_state_db,
+    clean_storage_json
+)
+from .backup import _do_full_backup
+
+# The platform cannot change during a run, so resolve it once
+_PLATFORM = get_platform()
+
+def _get_platform_cleaners():
+    """
+    Import this platform's cleaners, only when clean-all runs.
+
+    Returns:
+        tuple: (preview label, result label, cleaner) triples, in the order they run
+    """
+    if _PLATFORM == "windows":
+        from ...platforms.windows import clean_vscode_registry, clean_appdata_local
+        return (
+            ("Registry entries", "registry entries", clean_vscode_registry),
+            ("AppData\\Local files", "AppData\\Local files", clean_appdata_local)
+        )
+    if _PLATFORM == "macos":
+        from ...platforms.macos import clean_vscode_plist, clean_application_support
+        return (
+            ("Plist files", "plist files", clean_vscode_plist),
+            ("Application Support files", "Application Support files", clean_application_support)
+        )
+    from ...platforms.linux import clean_vscode_config, clean_dconf_settings
+    return (
+        ("Config files", "config files", clean_vscode_config),
+        ("dconf settings", "dconf settings", clean_dconf_settings)
+    )
+
+@click.command("clean-all")
+@click.option("--no-backup", is_flag=True, help="Don't create a backup before cleaning")
+@click.option("--force", is_flag=True, help="Don't ask for confirmation")
+def clean_all_cmd(no_backup, force):
+    """Clean all VSCode tracking data."""
+    platform_cleaners = _get_platform_cleaners()
+
+    if not force:
+        click.echo("This will clean all VSCode tracking data, including:")
+        click.echo("- Machine ID")
+        click.echo("- Extension data")
+        click.echo("- Global storage")
+        click.echo("- State database")
+        
+        for preview, _, _ in platform_cleaners:
+            click.echo(f"- {preview}")
+        
+        if not click.confirm("Do you want to continue?"):
+            return
+    
+    backup_id = None
+    if not no_backup:
+        backup_id = create_backup_id()
+        _do_full_backup(backup_id, echo=click.echo)
+        click.echo(f"Backup created with ID: {backup_id}")
+    
+    # Reset machine ID
+    success, _, _, _ = reset_machine_id(backup=False)  # Already backed up
+    if success:
+        click.echo("Reset machine ID")
+    
+    # Clean global storage
+    success, _ = clean_global_storage(backup=False)  # Already backed up
+    if success:
+        click.echo("Cleaned global storage")
+    
+    # Reset state database
+    success, _ = reset_state_db(backup=False)  # Already backed up
+    if success:
+        click.echo("Reset state database")
+    
+    # Clean storage.json
+    success = clean_storage_json()
+    if success:
+        click.echo("Cleaned storage.json")
+    
+    # Platform-specific cleaning
+    for _, result, cleaner in platform_cleaners:
+        if cleaner():
+            click.echo(f"Cleaned {result}")
+    
+    click.echo("Cleaning completed.")
@@ -0,0 +1,93 @@
+"""
+Commands for listing and resetting extension data.
+"""
+
+import click
+
+from . import prompt_choice
+from ...core.utils import get_extension_list
+from ...core.extension_data import list_extension_data, reset_extension_data
+from ...core.storage_cleaner import backup_global_storage
+
+@click.command("list-extensions")
+def list_extensions_cmd():
+    """List installed VSCode extensions."""
+    extensions = get_extension_list()
+    
+    if not extensions:
+        click.echo("No extensions found.")
+        return
+    
+    click.echo(f"Found {len(extensions)} installed extensions:")
+    for i, ext in enumerate(extensions, 1):
+        click.echo(f"{i}. {ext['name']} ({ext['id']}) - v{ext['version']}")
+
+@click.command("list-extension-data")
+def list_extension_data_cmd():
+    """List extensions with data in the global storage."""
+    extension_data = list_extension_data()
+    
+    if not extension_data:
+        click.echo("No extension data found.")
+        return
+    
+    click.echo(f"Found {len(extension_data)} extensions with data:")
+    for i, ext_id in enumerate(extension_data, 1):
+        click.echo(f"{i}. {ext_id}")
+
+@click.command("reset-extension")
+@click.argument("extension_id", required=False)
+@click.option("--no-backup", is_flag=True, help="Don't create a backup before resetting")
+def reset_extension_cmd(extension_id, no_backup):
+    """Reset a specific extension's data."""
+    if not extension_id:
+        # Interactive mode: let the user select an extension
+        extension_data = list_extension_data()
+        
+        if not extension_data:
+            click.echo("No extension data found.")
+            return
+        
+        extension_id = prompt_choice("Select an extension to reset", extension_data)
+    
+    success, backup_id = reset_extension_data(extension_id, backup=not no_backup)
+    
+    if success:
+        click.echo(f"Extension data for {extension_id} reset successfully!")
+        if backup_id:
+            click.echo(f"Backup created with ID: {backup_id}")
+    else:
+        click.echo(f"Failed to reset extension data for {extension_id}.")
+
+@click.command("reset-all-extensions")
+@click.option("--no-backup", is_flag=True, help="Don't create a backup before resetting")
+@click.option("--force", is_flag=True, help="Don't ask for confirmation")
+def reset_all_extensions_cmd(no_backup, force):
+    """Reset data for all extensions."""
+    extension_data = list_extension_data()
+    
+    if not extension_data:
+        click.echo("No extension data found.")
+        return
+    
+    if not force:
+        click.echo(f"This will reset data for {len(extension_data)} extensions:")
+        for i, ext_id in enumerate(extension_data, 1):
+            click.echo(f"{i}. {ext_id}")
+        
+        if not click.confirm("Do you want to continue?"):
+            return
+    
+    backup_id = None
+    if not no_backup:
+        backup_id, _ = backup_global_storage()
+        if backup_id:
+            click.echo(f"Backup created with ID: {backup_id}")
+    
+    success_count = 0
+    for ext_id in extension_data:
+        success, _ = reset_extension_data(ext_id, backup=False)  # Already backed up
+        if success:
+            success_count += 1
+    
+    click.echo(f"Reset data for {success_count}/{len(extension_data)} extensions.")
@@ -0,0 +1,25 @@
+"""
+The info command.
+"""
+
+import click
+
+from ...core.utils import get_platform, get_extension_list, list_backups_count
+from ...core.machine_id import get_current_machine_id
+from ...core.extension_data import list_extension_data_count
+
+@click.command("info")
+def info():
+    """Show information about the current VSCode installation."""
+    click.echo("VSCode Extension Resetter")
+    click.echo("------------------------")
+    click.echo(f"Platform: {get_platform()}")
+    
+    machine_id = get_current_machine_id()
+    click.echo(f"Machine ID: {machine_id or 'Not found'}")
+    
+    # Extensions are counted from their parsed manifests, as they're listed elsewhere
+    click.echo(f"Installed extensions: {len(get_extension_list())}")
+    # Only the totals are shown, so count entries instead of building lists
+    click.echo(f"Extensions with data: {list_extension_data_count()}")
+    click.echo(f"Available backups: {list_backups_count()}")
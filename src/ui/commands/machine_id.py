@@ -0,0 +1,22 @@
+"""
+The reset-machine-id command.
+"""
+
+import click
+
+from ...core.machine_id import reset_machine_id
+
+@click.command("reset-machine-id")
+@click.option("--no-backup", is_flag=True, help="Don't create a backup before resetting")
+def reset_machine_id_cmd(no_backup):
+    """Reset the VSCode machine ID."""
+    success, backup_id, old_id, new_id = reset_machine_id(backup=not no_backup)
+    
+    if success:
+        click.echo(f"Machine ID reset successfully!")
+        click.echo(f"Old ID: {old_id or 'Not found'}")
+        click.echo(f"New ID: {new_id}")
+        if backup_id:
+            click.echo(f"Backup created with ID: {backup_id}")
+    else:
+        click.echo("Failed to reset machine ID.")
@@ -6,16 +6,24 @@ For a more advanced GUI, consider using PyQt or wxPython.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
-import threading
-import queue
+from tkinter import ttk, messagebox, scrolledtext, filedialog
 import logging
+import functools
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ..core.utils import (
     get_platform,
     get_extension_list,
     list_backups,
+    create_backup_id,
+    backup_file,
+    get_machine_id_path,
+    get_backup_dir,
+    set_backup_dir,
     logger
 )
 from ..core.machine_id import (
@@ -38,38 +46,146 @@ from ..core.storage_cleaner import (
     clean_storage_json
 )
 
-# Import platform-specific modules
-if get_platform() == "windows":
+# The platform cannot change during a run, so resolve it once
+_PLATFORM = get_platform()
+
+# Import platform-specific modules, binding the cleaners Clean All runs in order
+if _PLATFORM == "windows":
     from ..platforms.windows import clean_vscode_registry, clean_appdata_local
-elif get_platform() == "macos":
+    _PLATFORM_CLEANERS = (clean_vscode_registry, clean_appdata_local)
+elif _PLATFORM == "macos":
     from ..platforms.macos import clean_vscode_plist, clean_application_support
+    _PLATFORM_CLEANERS = (clean_vscode_plist, clean_application_support)
 else:  # linux
     from ..platforms.linux import clean_vscode_config, clean_dconf_settings
+    _PLATFORM_CLEANERS = (clean_vscode_config, clean_dconf_settings)
+
+# What the Clean All tab lists, fixed for the platform we're running on
+CLEAN_ALL_DESCRIPTION = (
+    "This will clean all VSCode tracking data, including:\n\n"
+    "- Machine ID\n"
+    "- Extension data\n"
+    "- Global storage\n"
+    "- State database\n\n"
+) + {
+    "windows": "- Registry entries\n- AppData\\Local files\n",
+    "macos": "- Plist files\n- Application Support files\n",
+    "linux": "- Config files\n- dconf settings\n"
+}[_PLATFORM]
+
+# Most log records held for the GUI before the oldest are dropped
+LOG_QUEUE_SIZE = 10000
+
+# Largest amount of log text, in characters, added to the log widget in one insert
+LOG_INSERT_CHUNK = 64 * 1024
+
+# Default number of lines kept in the log widget
+MAX_LOG_LINES = 5000
+
+# ttk theme for the window, derived from the platform's default theme
+THEME_NAME = "vscr"
+THEME_SETTINGS = {
+    "TFrame": {"configure": {"background": "#f5f5f5"}},
+    "TLabel": {"configure": {"background": "#f5f5f5", "font": ("Segoe UI", 10)}},
+    "TButton": {"configure": {"font": ("Segoe UI", 10)}},
+    "TCheckbutton": {"configure": {"background": "#f5f5f5", "font": ("Segoe UI", 10)}},
+    "TNotebook": {"configure": {"background": "#f5f5f5", "tabposition": "n"}},
+    "TNotebook.Tab": {"configure": {"padding": [10, 5], "font": ("Segoe UI", 10)}},
+    "TLabelframe": {"configure": {"background": "#f5f5f5", "font": ("Segoe UI", 10)}},
+    "TLabelframe.Label": {"configure": {"background": "#f5f5f5", "font": ("Segoe UI", 10, "bold")}}
+}
+
+# How often the main loop checks for queued log lines, in milliseconds
+LOG_POLL_MS = 100
+
+# How long a status bar message stays up, in milliseconds
+STATUS_MESSAGE_MS = 5000
+
+# Worker threads shared by all button actions
+MAX_TASK_WORKERS = 4
+
+# Most extensions reset or backed up at once, across all running tasks
+MAX_EXTENSION_WORKERS = 8
+
+class LogFormatter(logging.Formatter):
+    """
+    A log formatter that renders each second's timestamp only once.
+
+    Output matches logging.Formatter's default asctime, including milliseconds.
+    """
+    def __init__(self, fmt=None):
+        super().__init__(fmt)
+        self.cached_second = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        second = int(record.created)
+        cached_at, text = self.cached_second
+        if cached_at != second:
+            text = time.strftime(self.default_time_format, self.converter(second))
+            # Stored as one tuple so threads logging at once never see a mismatched pair
+            self.cached_second = (second, text)
+        return self.default_msec_format % (text, record.msecs)
 
 class QueueHandler(logging.Handler):
     """
-    A logging handler that puts logs into a queue.
+    A logging handler that formats records as they are logged and queues the lines for the GUI.
+    
+    The queue is bounded and drops the oldest line when full. The handler never touches Tk;
+    it only flags that lines are pending, and the GUI's main loop checks the flag.
     """
     def __init__(self, log_queue):
         super().__init__()
         self.log_queue = log_queue
+        self.pending = threading.Event()
 
     def emit(self, record):
-        self.log_queue.put(record)
+        # Format now, on the logging thread, so the queue holds plain strings
+        # The deque is bounded, so appending to a full one discards the oldest line
+        self.log_queue.append(self.format(record))
+        self.pending.set()
+
+def coalesced(method):
+    """
+    Defer a refresh method to the next idle moment, dropping calls made while one is pending.
+
+    Bursts of actions then cause a single refresh of each view instead of one per action.
+
+    Args:
+        method (callable): Refresh method taking only self
+
+    Returns:
+        callable: Wrapped method
+    """
+    @functools.wraps(method)
+    def wrapper(self):
+        name = method.__name__
+        if name in self.pending_refreshes:
+            return
+        self.pending_refreshes.add(name)
+
+        def run():
+            self.pending_refreshes.discard(name)
+            method(self)
+
+        self.root.after_idle(run)
+
+    return wrapper
 
 class VSCodeResetterGUI:
     """
     Graphical user interface for VSCode Extension Resetter.
     """
-    def __init__(self, root):
+    def __init__(self, root, max_log_lines=MAX_LOG_LINES):
         self.root = root
+        self.max_log_lines = max_log_lines
+        self.pending_refreshes = set()
         self.root.title("VSCode Extension Resetter")
         self.root.geometry("950x750")
         self.root.minsize(950, 750)
 
         # Set application icon if available
         try:
-            if get_platform() == "windows":
+            if _PLATFORM == "windows":
                 self.root.iconbitmap("icon.ico")
             else:
                 icon = tk.PhotoImage(file="icon.png")
@@ -77,23 +193,24 @@ class VSCodeResetterGUI:
         except:
             pass
 
-        # Configure style
+        # Configure style: all settings go to Tk in one theme_create call
         self.style = ttk.Style()
-        self.style.configure("TFrame", background="#f5f5f5")
-        self.style.configure("TLabel", background="#f5f5f5", font=("Segoe UI", 10))
-        self.style.configure("TButton", font=("Segoe UI", 10))
-        self.style.configure("TCheckbutton", background="#f5f5f5", font=("Segoe UI", 10))
-        self.style.configure("TNotebook", background="#f5f5f5", tabposition="n")
-        self.style.configure("TNotebook.Tab", padding=[10, 5], font=("Segoe UI", 10))
-        self.style.configure("TLabelframe", background="#f5f5f5", font=("Segoe UI", 10))
-        self.style.configure("TLabelframe.Label", background="#f5f5f5", font=("Segoe UI", 10, "bold"))
-
-        # Set up logging to GUI
-        self.log_queue = queue.Queue()
+        if THEME_NAME not in self.style.theme_names():
+            self.style.theme_create(THEME_NAME, parent=self.style.theme_use(), settings=THEME_SETTINGS)
+        self.style.theme_use(THEME_NAME)
+
+        # Set up logging to GUI: records are formatted and queued as they are logged
+        self.log_queue = deque(maxlen=LOG_QUEUE_SIZE)
         self.queue_handler = QueueHandler(self.log_queue)
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        formatter = LogFormatter('%(asctime)s - %(levelname)s - %(message)s')
         self.queue_handler.setFormatter(formatter)
         logger.addHandler(self.queue_handler)
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+
+        # Button actions run on a small pool of reusable worker threads
+        self.task_executor = ThreadPoolExecutor(max_workers=MAX_TASK_WORKERS, thread_name_prefix="vscr-task")
+        # Per-extension work from every task shares one pool, so running tasks don't multiply threads
+        self.extension_executor = ThreadPoolExecutor(max_workers=MAX_EXTENSION_WORKERS, thread_name_prefix="vscr-ext")
 
         # Create the main frame
         self.main_frame = ttk.Frame(self.root, padding=15)
@@ -149,7 +266,7 @@ class VSCodeResetterGUI:
 
         # Add some initial text to the log
         logger.info("VSCode Extension Resetter started")
-        logger.info(f"Platform detected: {get_platform().capitalize()}")
+        logger.info(f"Platform detected: {_PLATFORM.capitalize()}")
 
         # Set the initial position of the paned window divider (70% for tabs, 30% for logs)
         self.root.update_idletasks()  # Make sure the window is drawn
@@ -161,9 +278,15 @@ class VSCodeResetterGUI:
         status_frame = ttk.Frame(self.main_frame)
         status_frame.pack(fill=tk.X, pady=(5, 0))
 
-        status_label = ttk.Label(status_frame, text=f"Platform: {get_platform().capitalize()}")
+        status_label = ttk.Label(status_frame, text=f"Platform: {_PLATFORM.capitalize()}")
         status_label.pack(side=tk.LEFT)
 
+        # Results of bulk actions are reported here instead of in a modal dialog
+        self.status_var = tk.StringVar()
+        self.status_clear_job = None
+        status_message_label = ttk.Label(status_frame, textvariable=self.status_var)
+        status_message_label.pack(side=tk.LEFT, padx=15)
+
         version_label = ttk.Label(status_frame, text="v0.2.0")
         version_label.pack(side=tk.RIGHT)
 
@@ -174,8 +297,39 @@ class VSCodeResetterGUI:
         self.init_backup_restore_tab()
         self.init_clean_all_tab()
 
-        # Start the log consumer
-        self.log_consumer()
+        # Each tab reads its data the first time it's shown, not while the window opens
+        self.tab_refreshers = {
+            str(self.info_tab): self.refresh_info,
+            str(self.machine_id_tab): self.refresh_machine_id,
+            str(self.extensions_tab): self.refresh_extensions,
+            str(self.backup_restore_tab): self.refresh_backups
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+        self.root.after_idle(self.on_tab_changed)
+
+        # Show whatever was logged before the main loop runs, then keep checking for new lines
+        self.log_poll_id = self.root.after_idle(self.poll_log)
+
+    def poll_log(self):
+        """
+        Flush the log if lines were queued since the last check, then check again shortly.
+
+        Only the Tk main loop runs this, so no other thread ever touches Tk.
+        """
+        pending = self.queue_handler.pending
+        if pending.is_set():
+            # Clear before draining, so lines logged during the flush are picked up next time
+            pending.clear()
+            self.flush_log()
+        self.log_poll_id = self.root.after(LOG_POLL_MS, self.poll_log)
+
+    def on_tab_changed(self, event=None):
+        """
+        Run the initial refresh of the selected tab, the first time it's shown.
+        """
+        refresh = self.tab_refreshers.pop(self.notebook.select(), None)
+        if refresh:
+            refresh()
 
     def clear_logs(self):
         """
@@ -184,19 +338,93 @@ class VSCodeResetterGUI:
         self.log_text.delete(1.0, tk.END)
         logger.info("Logs cleared")
 
-    def log_consumer(self):
+    def flush_log(self):
         """
-        Consume logs from the queue and display them in the log text widget.
+        Display the formatted log lines waiting in the log queue.
         """
-        try:
-            while True:
-                record = self.log_queue.get_nowait()
-                msg = self.queue_handler.format(record)
-                self.log_text.insert(tk.END, msg + "\n")
-                self.log_text.see(tk.END)
-                self.log_queue.task_done()
-        except queue.Empty:
-            self.root.after(100, self.log_consumer)
+        if not self.log_queue:
+            return
+
+        # Insert in as few calls as possible, but keep each insert bounded
+        batch = []
+        batch_size = 0
+        while True:
+            try:
+                line = self.log_queue.popleft()
+            except IndexError:
+                break
+            batch.append(line)
+            batch_size += len(line) + 1
+            if batch_size >= LOG_INSERT_CHUNK:
+                self.log_text.insert(tk.END, "\n".join(batch) + "\n")
+                batch = []
+                batch_size = 0
+
+        if batch:
+            self.log_text.insert(tk.END, "\n".join(batch) + "\n")
+
+        # Drop the oldest lines so the widget doesn't slow down as the session goes on
+        line_count = int(self.log_text.index("end-1c").split(".")[0])
+        if line_count > self.max_log_lines:
+            excess = line_count - self.max_log_lines
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+
+        self.log_text.see(tk.END)
+
+    def run_task(self, task):
+        """
+        Run a task on the worker pool, logging any exception it raises.
+
+        Args:
+            task (callable): Function to run in the background
+        """
+        def log_failure(future):
+            error = future.exception()
+            if error is not None:
+                logger.error(f"Background task failed: {error}")
+
+        self.task_executor.submit(task).add_done_callback(log_failure)
+
+    def run_on_ui(self, func, *args):
+        """
+        Schedule a call on the Tk main thread, for use from worker tasks.
+
+        Tkinter isn't thread-safe, so tasks must not touch widgets or dialogs directly.
+
+        Args:
+            func (callable): Function to call on the main thread
+            *args: Arguments to pass to func
+        """
+        self.root.after(0, func, *args)
+
+    def notify(self, message):
+        """
+        Show a message in the status bar for a few seconds. Safe to call from worker tasks.
+
+        Args:
+            message (str): Message to show
+        """
+        def show():
+            self.status_var.set(message)
+            if self.status_clear_job is not None:
+                self.root.after_cancel(self.status_clear_job)
+            self.status_clear_job = self.root.after(STATUS_MESSAGE_MS, clear)
+
+        def clear():
+            self.status_clear_job = None
+            self.status_var.set("")
+
+        self.run_on_ui(show)
+
+    def close(self):
+        """
+        Detach the GUI from the logger, stop taking new tasks and close the window.
+        """
+        logger.removeHandler(self.queue_handler)
+        self.root.after_cancel(self.log_poll_id)
+        self.task_executor.shutdown(wait=False)
+        self.extension_executor.shutdown(wait=False)
+        self.root.destroy()
 
     def init_info_tab(self):
         """
@@ -214,31 +442,51 @@ class VSCodeResetterGUI:
         refresh_button = ttk.Button(info_frame, text="Refresh", command=self.refresh_info)
         refresh_button.pack(pady=5)
 
-        # Initial refresh
-        self.refresh_info()
+    @coalesced
+    def refresh_all(self):
+        """
+        Refresh every tab, reading each piece of state only once.
+        """
+        machine_id = get_current_machine_id()
+        extension_data = list_extension_data()
+        backups = self.list_current_backups()
+
+        self.show_machine_id(machine_id)
+        self.show_extensions(extension_data)
+        self.show_backups(backups)
+        self.show_info(machine_id, extension_data, backups)
 
+    @coalesced
     def refresh_info(self):
         """
         Refresh the information in the Info tab.
         """
-        self.info_text.delete(1.0, tk.END)
-
-        self.info_text.insert(tk.END, "VSCode Extension Resetter\n")
-        self.info_text.insert(tk.END, "------------------------\n\n")
-
-        self.info_text.insert(tk.END, f"Platform: {get_platform()}\n\n")
+        self.show_info(get_current_machine_id(), list_extension_data(), self.list_current_backups())
 
-        machine_id = get_current_machine_id()
-        self.info_text.insert(tk.END, f"Machine ID: {machine_id or 'Not found'}\n\n")
+    def show_info(self, machine_id, extension_data, backups):
+        """
+        Fill the Info tab from already fetched state.
 
+        Args:
+            machine_id (str): Current machine ID, or None if not found
+            extension_data (list): IDs of extensions with data
+            backups (list): Available backup IDs
+        """
         extensions = get_extension_list()
-        self.info_text.insert(tk.END, f"Installed extensions: {len(extensions)}\n\n")
 
-        extension_data = list_extension_data()
-        self.info_text.insert(tk.END, f"Extensions with data: {len(extension_data)}\n\n")
+        # Build the whole text first so the widget is updated in one insert
+        text = (
+            "VSCode Extension Resetter\n"
+            "------------------------\n\n"
+            f"Platform: {_PLATFORM}\n\n"
+            f"Machine ID: {machine_id or 'Not found'}\n\n"
+            f"Installed extensions: {len(extensions)}\n\n"
+            f"Extensions with data: {len(extension_data)}\n\n"
+            f"Available backups: {len(backups)}\n\n"
+        )
 
-        backups = list_backups()
-        self.info_text.insert(tk.END, f"Available backups: {len(backups)}\n\n")
+        self.info_text.delete(1.0, tk.END)
+        self.info_text.insert(tk.END, text)
 
     def init_machine_id_tab(self):
         """
@@ -290,14 +538,20 @@ class VSCodeResetterGUI:
         )
         reset_button.pack(pady=5)
 
-        # Initial refresh
-        self.refresh_machine_id()
-
+    @coalesced
     def refresh_machine_id(self):
         """
         Refresh the machine ID information.
         """
-        machine_id = get_current_machine_id()
+        self.show_machine_id(get_current_machine_id())
+
+    def show_machine_id(self, machine_id):
+        """
+        Show an already fetched machine ID in the Machine ID tab.
+
+        Args:
+            machine_id (str): Current machine ID, or None if not found
+        """
         self.current_id_var.set(machine_id or "Not found")
 
     def reset_machine_id(self):
@@ -310,13 +564,13 @@ class VSCodeResetterGUI:
             success, _backup_id, old_id, new_id = reset_machine_id(backup=backup)
 
             if success:
-                messagebox.showinfo("Success", f"Machine ID reset successfully!\nOld ID: {old_id or 'Not found'}\nNew ID: {new_id}")
-                self.refresh_machine_id()
-                self.refresh_info()
+                self.run_on_ui(messagebox.showinfo, "Success", f"Machine ID reset successfully!\nOld ID: {old_id or 'Not found'}\nNew ID: {new_id}")
+                self.run_on_ui(self.refresh_machine_id)
+                self.run_on_ui(self.refresh_info)
             else:
-                messagebox.showerror("Error", "Failed to reset machine ID.")
+                self.run_on_ui(messagebox.showerror, "Error", "Failed to reset machine ID.")
 
-        threading.Thread(target=task).start()
+        self.run_task(task)
 
     def init_extensions_tab(self):
         """
@@ -396,18 +650,24 @@ class VSCodeResetterGUI:
         )
         reset_all_button.pack(side=tk.LEFT, padx=5)
 
-        # Initial refresh
-        self.refresh_extensions()
-
+    @coalesced
     def refresh_extensions(self):
         """
         Refresh the extensions list.
         """
-        self.extensions_listbox.delete(0, tk.END)
+        self.show_extensions(list_extension_data())
 
-        extension_data = list_extension_data()
-        for ext_id in extension_data:
-            self.extensions_listbox.insert(tk.END, ext_id)
+    def show_extensions(self, extension_data):
+        """
+        Fill the extensions list from already fetched state.
+
+        Args:
+            extension_data (list): IDs of extensions with data
+        """
+        self.extensions_listbox.delete(0, tk.END)
+        # A single insert call adds every item in one Tcl command
+        if extension_data:
+            self.extensions_listbox.insert(tk.END, *extension_data)
 
     def reset_selected_extensions(self):
         """
@@ -423,17 +683,17 @@ class VSCodeResetterGUI:
 
         if messagebox.askyesno("Confirm", f"Reset data for {len(selected_extensions)} selected extensions?"):
             def task():
-                success_count = 0
-                for ext_id in selected_extensions:
-                    success, _ = reset_extension_data(ext_id, backup=backup)
-                    if success:
-                        success_count += 1
+                # Each extension's data is independent, so reset them concurrently
+                results = self.extension_executor.map(
+                    lambda ext_id: reset_extension_data(ext_id, backup=backup)[0], selected_extensions
+                )
+                success_count = sum(results)
 
-                messagebox.showinfo("Success", f"Reset data for {success_count}/{len(selected_extensions)} extensions.")
-                self.refresh_extensions()
-                self.refresh_info()
+                self.notify(f"Reset data for {success_count}/{len(selected_extensions)} extensions.")
+                self.run_on_ui(self.refresh_extensions)
+                self.run_on_ui(self.refresh_info)
 
-            threading.Thread(target=task).start()
+            self.run_task(task)
 
     def reset_all_extensions(self):
         """
@@ -452,17 +712,16 @@ class VSCodeResetterGUI:
                     # Create a backup of all data
                     backup_global_storage()
 
-                success_count = 0
-                for ext_id in extension_data:
-                    success, _ = reset_extension_data(ext_id, backup=False)  # Already backed up
-                    if success:
-                        success_count += 1
+                # Already backed up, and each extension's data is independent
+                results = self.extension_executor.map(
+                    lambda ext_id: reset_extension_data(ext_id, backup=False)[0], extension_data
+                )
+                success_count = sum(results)
 
-                messagebox.showinfo("Success", f"Reset data for {success_count}/{len(extension_data)} extensions.")
-                self.refresh_extensions()
-                self.refresh_info()
+                self.notify(f"Reset data for {success_count}/{len(extension_data)} extensions.")
+                self.run_on_ui(self.refresh_all)
 
-            threading.Thread(target=task).start()
+            self.run_task(task)
 
     def init_backup_restore_tab(self):
         """
@@ -495,7 +754,6 @@ class VSCodeResetterGUI:
         location_frame.pack(fill=tk.X, pady=5)
 
         # Get default backup location
-        from ..core.utils import get_backup_dir
         default_location = str(get_backup_dir().parent)
 
         # Create location display
@@ -581,21 +839,15 @@ class VSCodeResetterGUI:
         )
         browse_restore_button.pack(side=tk.LEFT, padx=5)
 
-        # Initial refresh
-        self.refresh_backups()
-
     def browse_backup_location(self):
         """
         Open a directory browser to select a backup location.
         """
-        from tkinter import filedialog
-
         current_dir = self.backup_location_var.get()
         new_dir = filedialog.askdirectory(initialdir=current_dir, title="Select Backup Location")
 
         if new_dir:  # User selected a directory
             self.backup_location_var.set(new_dir)
-            from ..core.utils import set_backup_dir
             set_backup_dir(new_dir)
             self.refresh_backups()
             logger.info(f"Backup location changed to: {new_dir}")
@@ -604,8 +856,6 @@ class VSCodeResetterGUI:
         """
         Open a directory browser to select a backup to restore from.
         """
-        from tkinter import filedialog
-
         current_dir = self.backup_location_var.get()
         backup_dir = filedialog.askdirectory(initialdir=current_dir, title="Select Backup Directory")
 
@@ -620,16 +870,13 @@ class VSCodeResetterGUI:
                 # If user selected the parent directory, use it
                 if backup_path.name == "vscode_resetter_backups" or backup_path.name == "resetter_backups":
                     self.backup_location_var.set(str(backup_path.parent))
-                    from ..core.utils import set_backup_dir
                     set_backup_dir(str(backup_path.parent))
                 # If user selected a specific backup, use its parent
                 elif "backup_" in backup_path.name:
                     self.backup_location_var.set(str(backup_path.parent))
-                    from ..core.utils import set_backup_dir
                     set_backup_dir(str(backup_path.parent.parent))
                 else:
                     self.backup_location_var.set(str(backup_path))
-                    from ..core.utils import set_backup_dir
                     set_backup_dir(str(backup_path))
 
                 self.refresh_backups()
@@ -638,22 +885,37 @@ class VSCodeResetterGUI:
                 messagebox.showwarning("Invalid Backup Directory",
                                       "The selected directory does not appear to be a valid backup location.")
 
+    @coalesced
     def refresh_backups(self):
         """
         Refresh the backups list.
         """
-        self.backups_listbox.delete(0, tk.END)
+        self.show_backups(self.list_current_backups())
 
-        custom_dir = self.backup_location_var.get()
-        backups = list_backups(custom_dir)
+    def list_current_backups(self):
+        """
+        List the backups in the backup location chosen on the Backup & Restore tab.
+
+        Returns:
+            list: Available backup IDs
+        """
+        return list_backups(self.backup_location_var.get())
+
+    def show_backups(self, backups):
+        """
+        Fill the backups list from already fetched state.
+
+        Args:
+            backups (list): Available backup IDs
+        """
+        self.backups_listbox.delete(0, tk.END)
 
         if not backups:
             self.backups_listbox.insert(tk.END, "No backups found")
             self.backups_listbox.config(state=tk.DISABLED)
         else:
             self.backups_listbox.config(state=tk.NORMAL)
-            for backup_id in backups:
-                self.backups_listbox.insert(tk.END, backup_id)
+            self.backups_listbox.insert(tk.END, *backups)
 
     def create_backup(self):
         """
@@ -663,18 +925,14 @@ class VSCodeResetterGUI:
         custom_dir = self.backup_location_var.get()
 
         def task():
-            from ..core.utils import create_backup_id, set_backup_dir
-
             # Set the backup directory
             set_backup_dir(custom_dir)
 
             backup_id = create_backup_id()
 
             # Backup machine ID
-            from ..core.utils import get_machine_id_path
             machine_id_path = get_machine_id_path()
             if machine_id_path.exists():
-                from ..core.utils import backup_file
                 backup_file(machine_id_path, backup_id, custom_dir)
 
             # Backup global storage
@@ -683,18 +941,17 @@ class VSCodeResetterGUI:
             # Backup state database
             backup_state_db(backup_id)
 
-            # Backup extension data
+            # Backup extension data, each extension's tree copied concurrently
             if include_extensions:
                 extension_data = list_extension_data()
-                for ext_id in extension_data:
-                    backup_extension_data(ext_id, backup_id)
+                list(self.extension_executor.map(lambda ext_id: backup_extension_data(ext_id, backup_id), extension_data))
 
             backup_path = Path(custom_dir) / "vscode_resetter_backups" / backup_id
-            messagebox.showinfo("Success", f"Backup created with ID: {backup_id}\nLocation: {backup_path}")
-            self.refresh_backups()
-            self.refresh_info()
+            self.notify(f"Backup created with ID: {backup_id} in {backup_path}")
+            self.run_on_ui(self.refresh_backups)
+            self.run_on_ui(self.refresh_info)
 
-        threading.Thread(target=task).start()
+        self.run_task(task)
 
     def restore_backup(self):
         """
@@ -714,7 +971,6 @@ class VSCodeResetterGUI:
         if messagebox.askyesno("Confirm", f"Restore from backup {backup_id}?"):
             def task():
                 # Set the backup directory for restoration
-                from ..core.utils import set_backup_dir
                 set_backup_dir(custom_dir)
 
                 # Restore machine ID
@@ -724,19 +980,16 @@ class VSCodeResetterGUI:
                 restore_state_db(backup_id)
 
                 # Restore extension data
-                from ..core.utils import get_backup_dir
                 backup_dir = get_backup_dir() / backup_id / "extensions"
                 if backup_dir.exists():
                     extension_data = [d.name for d in backup_dir.iterdir() if d.is_dir()]
                     for ext_id in extension_data:
                         restore_extension_data(ext_id, backup_id)
 
-                messagebox.showinfo("Success", f"Restore from backup {backup_id} completed.")
-                self.refresh_machine_id()
-                self.refresh_extensions()
-                self.refresh_info()
+                self.run_on_ui(messagebox.showinfo, "Success", f"Restore from backup {backup_id} completed.")
+                self.run_on_ui(self.refresh_all)
 
-            threading.Thread(target=task).start()
+            self.run_task(task)
 
     def init_clean_all_tab(self):
         """
@@ -753,21 +1006,7 @@ class VSCodeResetterGUI:
         # Create the description text
         description_text = scrolledtext.ScrolledText(clean_all_frame, height=10, width=50)
         description_text.pack(fill=tk.BOTH, expand=True, pady=5)
-        description_text.insert(tk.END, "This will clean all VSCode tracking data, including:\n\n")
-        description_text.insert(tk.END, "- Machine ID\n")
-        description_text.insert(tk.END, "- Extension data\n")
-        description_text.insert(tk.END, "- Global storage\n")
-        description_text.insert(tk.END, "- State database\n\n")
-
-        if get_platform() == "windows":
-            description_text.insert(tk.END, "- Registry entries\n")
-            description_text.insert(tk.END, "- AppData\\Local files\n")
-        elif get_platform() == "macos":
-            description_text.insert(tk.END, "- Plist files\n")
-            description_text.insert(tk.END, "- Application Support files\n")
-        else:  # linux
-            description_text.insert(tk.END, "- Config files\n")
-            description_text.insert(tk.END, "- dconf settings\n")
+        description_text.insert(tk.END, CLEAN_ALL_DESCRIPTION)
 
         description_text.config(state=tk.DISABLED)
 
@@ -790,18 +1029,14 @@ class VSCodeResetterGUI:
         if messagebox.askyesno("Confirm", "Are you sure you want to clean all VSCode tracking data?"):
             def task():
                 if backup:
-                    from ..core.utils import create_backup_id, set_backup_dir
-
                     # Set the backup directory
                     set_backup_dir(custom_dir)
 
                     backup_id = create_backup_id()
 
                     # Backup machine ID
-                    from ..core.utils import get_machine_id_path
                     machine_id_path = get_machine_id_path()
                     if machine_id_path.exists():
-                        from ..core.utils import backup_file
                         backup_file(machine_id_path, backup_id, custom_dir)
 
                     # Backup global storage
@@ -827,23 +1062,13 @@ class VSCodeResetterGUI:
                 clean_storage_json()
 
                 # Platform-specific cleaning
-                if get_platform() == "windows":
-                    clean_vscode_registry()
-                    clean_appdata_local()
-                elif get_platform() == "macos":
-                    clean_vscode_plist()
-                    clean_application_support()
-                else:  # linux
-                    clean_vscode_config()
-                    clean_dconf_settings()
-
-                messagebox.showinfo("Success", "Cleaning completed.")
-                self.refresh_machine_id()
-                self.refresh_extensions()
-                self.refresh_backups()
-                self.refresh_info()
+                for cleaner in _PLATFORM_CLEANERS:
+                    cleaner()
+
+                self.run_on_ui(messagebox.showinfo, "Success", "Cleaning completed.")
+                self.run_on_ui(self.refresh_all)
 
-            threading.Thread(target=task).start()
+            self.run_task(task)
 
 def main():
     """
@@ -3,6 +3,8 @@ Tests for utility functions.
 """
 
 import os
+import sqlite3
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -13,15 +15,31 @@ from src.core.utils import (
     get_machine_id_path,
     get_extensions_path,
     get_backup_dir,
+    set_backup_dir,
     create_backup_id,
-    generate_new_machine_id
+    generate_new_machine_id,
+    copy_tree,
+    PARALLEL_COPY_MIN_FILES,
+    find_named,
+    find_machine_id_files,
+    list_backups,
+    list_backups_count
 )
+from src.core.extension_data import reset_extension_state_in_db
+from src.platforms import macos
 
 class TestUtils(unittest.TestCase):
     """
     Tests for utility functions.
     """
     
+    def setUp(self):
+        """
+        Clear the memoized path lookups so each test sees its own mocks.
+        """
+        for func in (get_platform, get_vscode_path, get_machine_id_path, get_extensions_path):
+            func.cache_clear()
+    
     def test_get_platform(self):
         """
         Test the get_platform function.
@@ -77,6 +95,7 @@ class TestUtils(unittest.TestCase):
         path = get_extensions_path()
         self.assertEqual(path, Path("/path/to/vscode/User/globalStorage"))
     
+    @patch("src.core.utils.DEFAULT_BACKUP_DIR", None)
     @patch("src.core.utils.get_vscode_path")
     def test_get_backup_dir(self, mock_get_vscode_path):
         """
@@ -87,15 +106,23 @@ class TestUtils(unittest.TestCase):
             path = get_backup_dir()
             self.assertEqual(path, Path("/path/to/vscode/resetter_backups"))
             mock_mkdir.assert_called_once_with(exist_ok=True, parents=True)
+
+            # The directory is created once, not on every call
+            self.assertEqual(get_backup_dir(), path)
+            self.assertEqual(set_backup_dir(), path)
+            mock_mkdir.assert_called_once_with(exist_ok=True, parents=True)
     
-    @patch("src.core.utils.datetime")
-    def test_create_backup_id(self, mock_datetime):
+    @patch("src.core.utils.time")
+    def test_create_backup_id(self, mock_time):
         """
         Test the create_backup_id function.
         """
-        mock_datetime.now.return_value.strftime.return_value = "20220101_120000"
+        mock_time.time.return_value = 1641038400
+        mock_time.strftime.return_value = "20220101_120000"
         backup_id = create_backup_id()
         self.assertEqual(backup_id, "backup_20220101_120000")
+        mock_time.strftime.assert_called_once_with("%Y%m%d_%H%M%S", mock_time.localtime.return_value)
+        mock_time.localtime.assert_called_once_with(1641038400)
     
     def test_generate_new_machine_id(self):
         """
@@ -104,6 +131,146 @@ class TestUtils(unittest.TestCase):
         machine_id = generate_new_machine_id()
         self.assertIsInstance(machine_id, str)
         self.assertGreater(len(machine_id), 0)
+        self.assertEqual(len(machine_id), 64)
+        int(machine_id, 16)
+        self.assertNotEqual(machine_id, generate_new_machine_id())
+
+    def test_copy_tree(self):
+        """
+        Test the copy_tree function.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / "src"
+            (src / "nested" / "deeper").mkdir(parents=True)
+            (src / "top.txt").write_text("top")
+            (src / "nested" / "deeper" / "leaf.txt").write_text("leaf")
+
+            dst = Path(tmp) / "dst"
+            copy_tree(src, dst)
+
+            self.assertEqual((dst / "top.txt").read_text(), "top")
+            self.assertEqual((dst / "nested" / "deeper" / "leaf.txt").read_text(), "leaf")
+
+    def test_copy_tree_many_files(self):
+        """
+        Test the copy_tree function on a tree large enough to use the I/O pool.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / "src"
+            (src / "nested").mkdir(parents=True)
+            for i in range(PARALLEL_COPY_MIN_FILES * 2):
+                (src / "nested" / f"file{i}.txt").write_text(str(i))
+
+            dst = Path(tmp) / "dst"
+            copy_tree(src, dst)
+
+            for i in range(PARALLEL_COPY_MIN_FILES * 2):
+                self.assertEqual((dst / "nested" / f"file{i}.txt").read_text(), str(i))
+
+    def test_find_named(self):
+        """
+        Test the find_named function.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "a" / "b").mkdir(parents=True)
+            (root / "machineid").write_text("1")
+            (root / "a" / "b" / "machineid").write_text("2")
+            (root / "a" / "other").write_text("3")
+
+            found = sorted(find_named(str(root), "machineid"))
+
+            self.assertEqual(found, sorted([str(root / "machineid"), str(root / "a" / "b" / "machineid")]))
+            self.assertEqual(list(find_named(str(root / "missing"), "machineid")), [])
+
+    def test_find_machine_id_files(self):
+        """
+        Test the find_machine_id_files function.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "User").mkdir()
+            (root / "deep" / "cache").mkdir(parents=True)
+            (root / "User" / "machineid").write_text("1")
+            (root / "deep" / "cache" / "machineid").write_text("2")
+
+            self.assertEqual(find_machine_id_files(tmp), [str(root / "User" / "machineid")])
+            self.assertEqual(len(find_machine_id_files(tmp, deep_scan=True)), 2)
+            self.assertEqual(find_machine_id_files(str(root / "missing")), [])
+
+            # With nothing in the known locations, the tree is searched
+            (root / "User" / "machineid").unlink()
+            self.assertEqual(find_machine_id_files(tmp), [str(root / "deep" / "cache" / "machineid")])
+
+    def test_clean_application_support_removes_nested_machine_id(self):
+        """
+        Test that the default Application Support clean still removes a nested machineid.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            nested = Path(tmp) / "Code" / "Cache" / "machineid"
+            nested.parent.mkdir(parents=True)
+            nested.write_text("1")
+
+            with patch.object(macos, "_APP_SUPPORT_PATHS", (Path(tmp) / "Code",)):
+                self.assertTrue(macos.clean_application_support())
+
+            self.assertFalse(nested.exists())
+
+    def test_list_backups_count(self):
+        """
+        Test the list_backups_count function.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertEqual(list_backups_count(tmp), 0)
+
+            backup_dir = Path(tmp) / "vscode_resetter_backups"
+            (backup_dir / "20220101_120000").mkdir(parents=True)
+            (backup_dir / "20220102_120000").mkdir()
+            (backup_dir / "plist_mtime.json").write_text("{}")
+
+            self.assertEqual(list_backups_count(tmp), 2)
+            self.assertEqual(list_backups_count(tmp), len(list_backups(tmp)))
+
+    def test_list_backups_sees_new_backups(self):
+        """
+        Test that list_backups' cached listing is dropped when a backup is added.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            backup_dir = Path(tmp) / "vscode_resetter_backups"
+            (backup_dir / "20220101_120000").mkdir(parents=True)
+            self.assertEqual(list_backups(tmp), ["20220101_120000"])
+
+            (backup_dir / "20220102_120000").mkdir()
+            self.assertEqual(sorted(list_backups(tmp)), ["20220101_120000", "20220102_120000"])
+
+    def test_reset_extension_state_in_db(self):
+        """
+        Test that resetting an extension's state treats "_" in its ID literally.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            db_dir = Path(tmp) / "User" / "globalStorage"
+            db_dir.mkdir(parents=True)
+            db_path = db_dir / "state.vscdb"
+
+            conn = sqlite3.connect(str(db_path))
+            conn.execute("CREATE TABLE ItemTable (key TEXT UNIQUE ON CONFLICT REPLACE, value BLOB)")
+            conn.executemany(
+                "INSERT INTO ItemTable VALUES (?, ?)",
+                [("pub.ext_a", "1"), ("workbench.pub.ext_a.state", "2"),
+                 ("pub.extXa", "3"), ("workbench.pub.extXa.state", "4")]
+            )
+            conn.commit()
+            conn.close()
+
+            with patch("src.core.extension_data.get_vscode_path", return_value=Path(tmp)), \
+                 patch("src.core.extension_data.backup_file"):
+                self.assertTrue(reset_extension_state_in_db("pub.ext_a"))
+
+            conn = sqlite3.connect(str(db_path))
+            keys = sorted(row[0] for row in conn.execute("SELECT key FROM ItemTable"))
+            conn.close()
+
+            self.assertEqual(keys, ["pub.extXa", "workbench.pub.extXa.state"])
 
 if __name__ == "__main__":
     unittest.main()